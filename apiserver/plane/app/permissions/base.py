@@ -41,13 +41,16 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
                 ).exists():
                     return view_func(instance, request, *args, **kwargs)
             else:
-                if ProjectMember.objects.filter(
+                project_member = ProjectMember.objects.filter(
                     member=request.user,
                     workspace__slug=kwargs["slug"],
                     project_id=kwargs["project_id"],
                     role__in=allowed_role_values,
                     is_active=True,
-                ).exists():
+                ).first()
+                if project_member:
+                    # Keep the membership on the request for the view
+                    request.project_member = project_member
                     return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
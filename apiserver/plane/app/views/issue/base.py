@@ -1,10 +1,9 @@
 # Python imports
-import json
+from collections import defaultdict
 
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
-from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
     Exists,
     F,
@@ -16,11 +15,13 @@ from django.db.models import (
     Value,
 )
 from django.db.models.functions import Coalesce
+from django.http import HttpResponse, QueryDict
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 
 # Third Party imports
+import orjson
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -41,22 +42,26 @@ from plane.db.models import (
     IssueReaction,
     IssueSubscriber,
     Project,
-    ProjectMember,
 )
 from plane.utils.grouper import (
     issue_group_values,
+    issue_group_values_multi,
     issue_on_results,
     issue_queryset_grouper,
 )
-from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_filters import get_issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
-    GroupedOffsetPaginator,
-    SubGroupedOffsetPaginator,
+    EstimatedCountGroupedOffsetPaginator,
+    EstimatedCountSubGroupedOffsetPaginator,
+    FastCountKeysetPaginator,
+    FastCountOffsetPaginator,
+    KeysetCursor,
 )
 from .. import BaseAPIView, BaseViewSet
 from plane.utils.user_timezone_converter import user_timezone_converter
 from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.deferred_tasks import defer_task
 from plane.utils.global_paginator import paginate
 
 
@@ -79,9 +84,17 @@ class IssueListEndpoint(BaseAPIView):
             Issue.issue_objects.filter(
                 workspace__slug=slug, project_id=project_id, pk__in=issue_ids
             )
-            .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .defer(
+                "description_html",
+                "description_stripped",
+                "description_binary",
+                "parent__description",
+                "parent__description_html",
+                "parent__description_stripped",
+                "parent__description_binary",
+            )
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(
                 link_count=IssueLink.objects.filter(issue=OuterRef("id"))
@@ -107,7 +120,7 @@ class IssueListEndpoint(BaseAPIView):
             )
         ).distinct()
 
-        filters = issue_filters(request.query_params, "GET")
+        filters = get_issue_filters(request)
 
         order_by_param = request.GET.get("order_by", "-created_at")
         issue_queryset = queryset.filter(**filters)
@@ -128,7 +141,8 @@ class IssueListEndpoint(BaseAPIView):
             sub_group_by=sub_group_by,
         )
 
-        recent_visited_task.delay(
+        defer_task(
+            recent_visited_task,
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -173,6 +187,12 @@ class IssueListEndpoint(BaseAPIView):
             issues = user_timezone_converter(
                 issues, datetime_fields, request.user.user_timezone
             )
+            # Encode the plain rows directly, skipping the DRF renderer
+            return HttpResponse(
+                orjson.dumps(issues, default=str, option=orjson.OPT_UTC_Z),
+                content_type="application/json",
+                status=status.HTTP_200_OK,
+            )
         return Response(issues, status=status.HTTP_200_OK)
 
 
@@ -205,6 +225,15 @@ class IssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .defer(
+                "description_html",
+                "description_stripped",
+                "description_binary",
+                "parent__description",
+                "parent__description_html",
+                "parent__description_stripped",
+                "parent__description_binary",
+            )
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(
                 link_count=IssueLink.objects.filter(issue=OuterRef("id"))
@@ -233,7 +262,7 @@ class IssueViewSet(BaseViewSet):
     @method_decorator(gzip_page)
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.GUEST])
     def list(self, request, slug, project_id):
-        filters = issue_filters(request.query_params, "GET")
+        filters = get_issue_filters(request)
         order_by_param = request.GET.get("order_by", "-created_at")
 
         issue_queryset = self.get_queryset().filter(**filters)
@@ -256,21 +285,25 @@ class IssueViewSet(BaseViewSet):
             sub_group_by=sub_group_by,
         )
 
-        recent_visited_task.delay(
+        defer_task(
+            recent_visited_task,
             slug=slug,
             project_id=project_id,
             entity_name="project",
             entity_identifier=project_id,
             user_id=request.user.id,
         )
-        if ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            role=5,
-            is_active=True,
-        ).exists():
+        # Filtered issues without the response annotations for the counts
+        filtered_queryset = Issue.issue_objects.filter(
+            workspace__slug=slug, project_id=project_id
+        ).filter(**filters)
+
+        project_member = getattr(request, "project_member", None)
+        if project_member and project_member.role == 5:
             issue_queryset = issue_queryset.filter(created_by=request.user)
+            filtered_queryset = filtered_queryset.filter(
+                created_by=request.user
+            )
 
         if group_by:
             if sub_group_by:
@@ -282,38 +315,29 @@ class IssueViewSet(BaseViewSet):
                         status=status.HTTP_400_BAD_REQUEST,
                     )
                 else:
+                    group_by_fields, sub_group_by_fields = (
+                        issue_group_values_multi(
+                            fields=[group_by, sub_group_by],
+                            slug=slug,
+                            project_id=project_id,
+                            filters=filters,
+                        )
+                    )
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
                         queryset=issue_queryset,
+                        filtered_queryset=filtered_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
                             issues=issues,
                             sub_group_by=sub_group_by,
                         ),
-                        paginator_cls=SubGroupedOffsetPaginator,
-                        group_by_fields=issue_group_values(
-                            field=group_by,
-                            slug=slug,
-                            project_id=project_id,
-                            filters=filters,
-                        ),
-                        sub_group_by_fields=issue_group_values(
-                            field=sub_group_by,
-                            slug=slug,
-                            project_id=project_id,
-                            filters=filters,
-                        ),
+                        paginator_cls=EstimatedCountSubGroupedOffsetPaginator,
+                        group_by_fields=group_by_fields,
+                        sub_group_by_fields=sub_group_by_fields,
                         group_by_field_name=group_by,
                         sub_group_by_field_name=sub_group_by,
-                        count_filter=Q(
-                            Q(issue_inbox__status=1)
-                            | Q(issue_inbox__status=-1)
-                            | Q(issue_inbox__status=2)
-                            | Q(issue_inbox__isnull=True),
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
                     )
             else:
                 # Group paginate
@@ -321,12 +345,13 @@ class IssueViewSet(BaseViewSet):
                     request=request,
                     order_by=order_by_param,
                     queryset=issue_queryset,
+                    filtered_queryset=filtered_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
                         issues=issues,
                         sub_group_by=sub_group_by,
                     ),
-                    paginator_cls=GroupedOffsetPaginator,
+                    paginator_cls=EstimatedCountGroupedOffsetPaginator,
                     group_by_fields=issue_group_values(
                         field=group_by,
                         slug=slug,
@@ -334,23 +359,38 @@ class IssueViewSet(BaseViewSet):
                         filters=filters,
                     ),
                     group_by_field_name=group_by,
-                    count_filter=Q(
-                        Q(issue_inbox__status=1)
-                        | Q(issue_inbox__status=-1)
-                        | Q(issue_inbox__status=2)
-                        | Q(issue_inbox__isnull=True),
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
                 )
         else:
+            # Use keyset pagination for the default ordering when the client
+            # sends a keyset cursor, other cursors keep the offset pagination
+            cursor = request.GET.get(self.cursor_name)
+            if (
+                order_by_param == "-created_at"
+                and cursor is not None
+                and KeysetCursor.is_keyset(cursor)
+            ):
+                return self.paginate(
+                    order_by=order_by_param,
+                    request=request,
+                    queryset=issue_queryset,
+                    filtered_queryset=filtered_queryset,
+                    on_results=lambda issues: issue_on_results(
+                        group_by=group_by,
+                        issues=issues,
+                        sub_group_by=sub_group_by,
+                    ),
+                    paginator_cls=FastCountKeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                )
             return self.paginate(
                 order_by=order_by_param,
                 request=request,
                 queryset=issue_queryset,
+                filtered_queryset=filtered_queryset,
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                paginator_cls=FastCountOffsetPaginator,
             )
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -370,11 +410,18 @@ class IssueViewSet(BaseViewSet):
             serializer.save()
 
             # Track the issue
-            issue_activity.delay(
+            defer_task(
+                issue_activity,
                 type="issue.activity.created",
-                requested_data=json.dumps(
-                    self.request.data, cls=DjangoJSONEncoder
-                ),
+                requested_data=orjson.dumps(
+                    (
+                        self.request.data.dict()
+                        if isinstance(self.request.data, QueryDict)
+                        else self.request.data
+                    ),
+                    default=str,
+                    option=orjson.OPT_UTC_Z,
+                ).decode(),
                 actor_id=str(request.user.id),
                 issue_id=str(serializer.data.get("id", None)),
                 project_id=str(project_id),
@@ -383,44 +430,46 @@ class IssueViewSet(BaseViewSet):
                 notification=True,
                 origin=request.META.get("HTTP_ORIGIN"),
             )
-            issue = (
-                issue_queryset_grouper(
-                    queryset=self.get_queryset().filter(
-                        pk=serializer.data["id"]
-                    ),
-                    group_by=None,
-                    sub_group_by=None,
-                )
-                .values(
-                    "id",
-                    "name",
-                    "state_id",
-                    "sort_order",
-                    "completed_at",
-                    "estimate_point",
-                    "priority",
-                    "start_date",
-                    "target_date",
-                    "sequence_id",
-                    "project_id",
-                    "parent_id",
-                    "cycle_id",
-                    "module_ids",
-                    "label_ids",
-                    "assignee_ids",
-                    "sub_issues_count",
-                    "created_at",
-                    "updated_at",
-                    "created_by",
-                    "updated_by",
-                    "attachment_count",
-                    "link_count",
-                    "is_draft",
-                    "archived_at",
-                    "deleted_at",
-                )
-                .first()
-            )
+            # Build the response from the saved instance, a new issue has
+            # no links, attachments, sub issues, cycle or modules yet
+            instance = serializer.instance
+            assignee_ids = [
+                user.id
+                for user in serializer.validated_data.get("assignee_ids", [])
+            ]
+            if not assignee_ids and project.default_assignee_id is not None:
+                assignee_ids = [project.default_assignee_id]
+            issue = {
+                "id": instance.id,
+                "name": instance.name,
+                "state_id": instance.state_id,
+                "sort_order": instance.sort_order,
+                "completed_at": instance.completed_at,
+                "estimate_point": instance.estimate_point_id,
+                "priority": instance.priority,
+                "start_date": instance.start_date,
+                "target_date": instance.target_date,
+                "sequence_id": instance.sequence_id,
+                "project_id": instance.project_id,
+                "parent_id": instance.parent_id,
+                "cycle_id": None,
+                "module_ids": [],
+                "label_ids": [
+                    label.id
+                    for label in serializer.validated_data.get("label_ids", [])
+                ],
+                "assignee_ids": assignee_ids,
+                "sub_issues_count": 0,
+                "created_at": instance.created_at,
+                "updated_at": instance.updated_at,
+                "created_by": instance.created_by_id,
+                "updated_by": instance.updated_by_id,
+                "attachment_count": 0,
+                "link_count": 0,
+                "is_draft": instance.is_draft,
+                "archived_at": instance.archived_at,
+                "deleted_at": instance.deleted_at,
+            }
             datetime_fields = ["created_at", "updated_at"]
             issue = user_timezone_converter(
                 issue, datetime_fields, request.user.user_timezone
@@ -434,6 +483,16 @@ class IssueViewSet(BaseViewSet):
     def retrieve(self, request, slug, project_id, pk=None):
         issue = (
             self.get_queryset()
+            # The detail view returns the description html
+            .defer(None)
+            .defer(
+                "description_stripped",
+                "description_binary",
+                "parent__description",
+                "parent__description_html",
+                "parent__description_stripped",
+                "parent__description_binary",
+            )
             .filter(pk=pk)
             .annotate(
                 label_ids=Coalesce(
@@ -500,7 +559,8 @@ class IssueViewSet(BaseViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        recent_visited_task.delay(
+        defer_task(
+            recent_visited_task,
             slug=slug,
             entity_name="issue",
             entity_identifier=pk,
@@ -515,6 +575,14 @@ class IssueViewSet(BaseViewSet):
     def partial_update(self, request, slug, project_id, pk=None):
         issue = (
             self.get_queryset()
+            # Load the complete row as the issue is saved back
+            .defer(None)
+            .defer(
+                "parent__description",
+                "parent__description_html",
+                "parent__description_stripped",
+                "parent__description_binary",
+            )
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -552,17 +620,30 @@ class IssueViewSet(BaseViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        current_instance = json.dumps(
-            IssueSerializer(issue).data, cls=DjangoJSONEncoder
-        )
-
-        requested_data = json.dumps(self.request.data, cls=DjangoJSONEncoder)
+        current_instance = orjson.dumps(
+            IssueSerializer(issue).data,
+            default=str,
+            option=orjson.OPT_UTC_Z,
+        ).decode()
+
+        # Form bodies hold lists per key, use their last values like
+        # json.dumps did
+        requested_data = orjson.dumps(
+            (
+                self.request.data.dict()
+                if isinstance(self.request.data, QueryDict)
+                else self.request.data
+            ),
+            default=str,
+            option=orjson.OPT_UTC_Z,
+        ).decode()
         serializer = IssueCreateSerializer(
             issue, data=request.data, partial=True
         )
         if serializer.is_valid():
             serializer.save()
-            issue_activity.delay(
+            defer_task(
+                issue_activity,
                 type="issue.activity.updated",
                 requested_data=requested_data,
                 actor_id=str(request.user.id),
@@ -573,20 +654,21 @@ class IssueViewSet(BaseViewSet):
                 notification=True,
                 origin=request.META.get("HTTP_ORIGIN"),
             )
-            issue = self.get_queryset().filter(pk=pk).first()
             return Response(status=status.HTTP_204_NO_CONTENT)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @allow_permission([ROLE.ADMIN], creator=True, model=Issue)
     def destroy(self, request, slug, project_id, pk=None):
-        issue = Issue.objects.get(
-            workspace__slug=slug, project_id=project_id, pk=pk
-        )
+        # Skip the columns that the soft delete does not write back
+        issue = Issue.objects.defer(
+            "description", "description_stripped", "description_binary"
+        ).get(workspace__slug=slug, project_id=project_id, pk=pk)
 
         issue.delete()
-        issue_activity.delay(
+        defer_task(
+            issue_activity,
             type="issue.activity.deleted",
-            requested_data=json.dumps({"issue_id": str(pk)}),
+            requested_data=orjson.dumps({"issue_id": str(pk)}).decode(),
             actor_id=str(request.user.id),
             issue_id=str(pk),
             project_id=str(project_id),
@@ -621,9 +703,28 @@ class IssueUserDisplayPropertyEndpoint(BaseAPIView):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST, ROLE.VIEWER])
     def get(self, request, slug, project_id):
-        issue_property, _ = IssueUserProperty.objects.get_or_create(
+        issue_property = IssueUserProperty.objects.filter(
             user=request.user, project_id=project_id
-        )
+        ).first()
+        if issue_property is None:
+            # Insert without the savepoint and project lookup of
+            # get_or_create, a concurrent insert hits the unique constraint
+            # and is skipped
+            IssueUserProperty.objects.bulk_create(
+                [
+                    IssueUserProperty(
+                        user=request.user,
+                        project_id=project_id,
+                        workspace_id=request.project_member.workspace_id,
+                        created_by=request.user,
+                        updated_by=request.user,
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            issue_property = IssueUserProperty.objects.get(
+                user=request.user, project_id=project_id
+            )
         serializer = IssueUserPropertySerializer(issue_property)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -664,6 +765,15 @@ class IssuePaginatedViewSet(BaseViewSet):
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
+            .defer(
+                "description_html",
+                "description_stripped",
+                "description_binary",
+                "parent__description",
+                "parent__description_html",
+                "parent__description_stripped",
+                "parent__description_binary",
+            )
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(
                 link_count=IssueLink.objects.filter(issue=OuterRef("id"))
@@ -689,8 +799,46 @@ class IssuePaginatedViewSet(BaseViewSet):
             )
         ).distinct()
 
+    def get_related_ids(self, issue_ids, field, condition):
+        # Collect the related ids of each issue through the m2m join
+        related_ids = defaultdict(list)
+        for issue_id, related_id in (
+            Issue.objects.filter(condition, pk__in=issue_ids)
+            .values_list("id", field)
+            .distinct()
+            .order_by(field)
+        ):
+            related_ids[issue_id].append(related_id)
+        return related_ids
+
     def process_paginated_result(self, fields, results, timezone):
-        paginated_data = results.values(*fields)
+        paginated_data = list(results.values(*fields))
+        issue_ids = [issue["id"] for issue in paginated_data]
+
+        # fetching the m2m ids of the paginated issues
+        label_ids = self.get_related_ids(
+            issue_ids, "labels__id", Q(labels__id__isnull=False)
+        )
+        assignee_ids = self.get_related_ids(
+            issue_ids,
+            "assignees__id",
+            Q(
+                assignees__id__isnull=False,
+                assignees__member_project__is_active=True,
+            ),
+        )
+        module_ids = self.get_related_ids(
+            issue_ids,
+            "issue_module__module_id",
+            Q(
+                issue_module__module_id__isnull=False,
+                issue_module__module__archived_at__isnull=True,
+            ),
+        )
+        for issue in paginated_data:
+            issue["label_ids"] = label_ids[issue["id"]]
+            issue["assignee_ids"] = assignee_ids[issue["id"]]
+            issue["module_ids"] = module_ids[issue["id"]]
 
         # converting the datetime fields in paginated data
         datetime_fields = ["created_at", "updated_at"]
@@ -728,9 +876,6 @@ class IssuePaginatedViewSet(BaseViewSet):
             "is_draft",
             "archived_at",
             "deleted_at",
-            "module_ids",
-            "label_ids",
-            "assignee_ids",
             "link_count",
             "attachment_count",
             "sub_issues_count",
@@ -750,35 +895,6 @@ class IssuePaginatedViewSet(BaseViewSet):
             base_queryset = base_queryset.filter(updated_at__gte=updated_at)
             queryset = queryset.filter(updated_at__gte=updated_at)
 
-        queryset = queryset.annotate(
-            label_ids=Coalesce(
-                ArrayAgg(
-                    "labels__id",
-                    distinct=True,
-                    filter=~Q(labels__id__isnull=True),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            assignee_ids=Coalesce(
-                ArrayAgg(
-                    "assignees__id",
-                    distinct=True,
-                    filter=~Q(assignees__id__isnull=True)
-                    & Q(assignees__member_project__is_active=True),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            module_ids=Coalesce(
-                ArrayAgg(
-                    "issue_module__module_id",
-                    distinct=True,
-                    filter=~Q(issue_module__module_id__isnull=True)
-                    & Q(issue_module__module__archived_at__isnull=True),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-        )
-
         paginated_data = paginate(
             base_queryset=base_queryset,
             queryset=queryset,
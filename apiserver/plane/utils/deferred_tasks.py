@@ -0,0 +1,43 @@
+# Python imports
+from contextvars import ContextVar
+
+# Django imports
+from django.core.signals import request_finished
+from django.dispatch import receiver
+
+# Third party imports
+from celery import group
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+
+# Celery signatures queued while handling the current request
+pending_tasks = ContextVar("pending_tasks", default=None)
+
+
+def defer_task(task, **kwargs):
+    """
+    Queue the task to be sent to the broker once the response is finished,
+    instead of calling `task.delay(**kwargs)` while the request is open.
+    Meant to be called from views only.
+    """
+    tasks = pending_tasks.get()
+    if tasks is None:
+        tasks = []
+        pending_tasks.set(tasks)
+    tasks.append(task.s(**kwargs))
+
+
+@receiver(request_finished)
+def send_deferred_tasks(sender, **kwargs):
+    tasks = pending_tasks.get()
+    if not tasks:
+        return
+
+    # Reset the queue for the next request served by this context
+    pending_tasks.set(None)
+    try:
+        # Send all the tasks queued by the request together
+        group(tasks).apply_async()
+    except Exception as e:
+        log_exception(e)
@@ -1,8 +1,8 @@
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
-from django.db.models import Q, UUIDField, Value
-from django.db.models.functions import Coalesce
+from django.db.models import CharField, Q, TextField, UUIDField, Value
+from django.db.models.functions import Cast, Coalesce
 
 # Module imports
 from plane.db.models import (
@@ -99,60 +99,60 @@ def issue_on_results(issues, group_by, sub_group_by):
     return issues.values(*required_fields)
 
 
-def issue_group_values(field, slug, project_id=None, filters=dict):
+def issue_group_values_queryset(field, slug, project_id=None, filters=dict):
+    """
+    Return the flat values queryset for the group values of the field along
+    with the static values that are appended to its results. The queryset
+    is None for fields whose group values are fixed.
+    """
     if field == "state_id":
         queryset = State.objects.filter(
             is_triage=False,
             workspace__slug=slug,
         ).values_list("id", flat=True)
         if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
+            queryset = queryset.filter(project_id=project_id)
+        return queryset, []
     if field == "labels__id":
         queryset = Label.objects.filter(workspace__slug=slug).values_list(
             "id", flat=True
         )
         if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        else:
-            return list(queryset) + ["None"]
+            queryset = queryset.filter(project_id=project_id)
+        return queryset, ["None"]
     if field == "assignees__id":
         if project_id:
-            return ProjectMember.objects.filter(
+            queryset = ProjectMember.objects.filter(
                 workspace__slug=slug,
                 project_id=project_id,
                 is_active=True,
             ).values_list("member_id", flat=True)
         else:
-            return list(
-                WorkspaceMember.objects.filter(
-                    workspace__slug=slug, is_active=True
-                ).values_list("member_id", flat=True)
-            )
+            queryset = WorkspaceMember.objects.filter(
+                workspace__slug=slug, is_active=True
+            ).values_list("member_id", flat=True)
+        return queryset, []
     if field == "issue_module__module_id":
         queryset = Module.objects.filter(
             workspace__slug=slug,
         ).values_list("id", flat=True)
         if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        else:
-            return list(queryset) + ["None"]
+            queryset = queryset.filter(project_id=project_id)
+        return queryset, ["None"]
     if field == "cycle_id":
         queryset = Cycle.objects.filter(
             workspace__slug=slug,
         ).values_list("id", flat=True)
         if project_id:
-            return list(queryset.filter(project_id=project_id)) + ["None"]
-        else:
-            return list(queryset) + ["None"]
+            queryset = queryset.filter(project_id=project_id)
+        return queryset, ["None"]
     if field == "project_id":
         queryset = Project.objects.filter(workspace__slug=slug).values_list(
             "id", flat=True
         )
-        return list(queryset)
+        return queryset, []
     if field == "priority":
-        return [
+        return None, [
             "low",
             "medium",
             "high",
@@ -160,46 +160,69 @@ def issue_group_values(field, slug, project_id=None, filters=dict):
             "none",
         ]
     if field == "state__group":
-        return [
+        return None, [
             "backlog",
             "unstarted",
             "started",
             "completed",
             "cancelled",
         ]
-    if field == "target_date":
-        queryset = (
-            Issue.issue_objects.filter(workspace__slug=slug)
-            .filter(**filters)
-            .values_list("target_date", flat=True)
-            .distinct()
-        )
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
-    if field == "start_date":
+    if field in ["target_date", "start_date", "created_by"]:
         queryset = (
             Issue.issue_objects.filter(workspace__slug=slug)
             .filter(**filters)
-            .values_list("start_date", flat=True)
+            .values_list(field, flat=True)
             .distinct()
         )
         if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
+            queryset = queryset.filter(project_id=project_id)
+        return queryset, []
 
-    if field == "created_by":
-        queryset = (
-            Issue.issue_objects.filter(workspace__slug=slug)
-            .filter(**filters)
-            .values_list("created_by", flat=True)
-            .distinct()
+    return None, []
+
+
+def issue_group_values(field, slug, project_id=None, filters=dict):
+    queryset, values = issue_group_values_queryset(
+        field=field, slug=slug, project_id=project_id, filters=filters
+    )
+    if queryset is None:
+        return values
+    return list(queryset) + values
+
+
+def issue_group_values_multi(fields, slug, project_id=None, filters=dict):
+    """
+    Return the group values for each of the fields, fetching the values of
+    all the fields that need a lookup in a single UNION ALL query tagged
+    with the field name. The values from the query are returned as strings.
+    """
+    group_values = {}
+    querysets = []
+    for field in fields:
+        queryset, group_values[field] = issue_group_values_queryset(
+            field=field, slug=slug, project_id=project_id, filters=filters
         )
-        if project_id:
-            return list(queryset.filter(project_id=project_id))
-        else:
-            return list(queryset)
+        if queryset is None:
+            continue
+        # Tag the values with the field name and cast them to a common type
+        column = queryset.query.values_select[0]
+        querysets.append(
+            queryset.order_by()
+            .annotate(
+                group_field=Value(field, output_field=CharField()),
+                group_value=Cast(column, output_field=TextField()),
+            )
+            .values_list("group_field", "group_value")
+        )
+
+    if not querysets:
+        return [group_values[field] for field in fields]
+
+    # Split the combined rows back into the values of each field
+    query_values = {field: [] for field in fields}
+    for group_field, group_value in querysets[0].union(
+        *querysets[1:], all=True
+    ):
+        query_values[group_field].append(group_value)
 
-    return []
+    return [query_values[field] + group_values[field] for field in fields]
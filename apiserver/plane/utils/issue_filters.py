@@ -559,3 +559,10 @@ def issue_filters(query_params, method, prefix=""):
             func = value
             func(query_params, issue_filter, method, prefix)
     return issue_filter
+
+
+def get_issue_filters(request):
+    # Parse the GET issue filters once and keep them on the request
+    if not hasattr(request, "_issue_filters"):
+        request._issue_filters = issue_filters(request.query_params, "GET")
+    return request._issue_filters
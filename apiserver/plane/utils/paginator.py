@@ -1,13 +1,19 @@
 # Python imports
+import json
 import math
+import uuid
 from collections import defaultdict
 from collections.abc import Sequence
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.db import OperationalError, connections, transaction
+from django.db.models import Count, F, Q, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
+from psycopg.errors import QueryCanceled
 from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
@@ -104,6 +110,7 @@ class OffsetPaginator:
         max_limit=MAX_LIMIT,
         max_offset=None,
         on_results=None,
+        filtered_queryset=None,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -117,6 +124,11 @@ class OffsetPaginator:
         self.max_limit = max_limit
         self.max_offset = max_offset
         self.on_results = on_results
+        # The queryset with only the filters applied, without the joins of
+        # the response annotations
+        self.filtered_queryset = filtered_queryset
+        # Set when the count is an estimate instead of an exact count
+        self.is_estimated = False
 
     def get_result(self, limit=100, cursor=None):
         # offset is page #
@@ -167,7 +179,7 @@ class OffsetPaginator:
             results = self.on_results(results)
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_count(queryset)
 
         # Optionally, calculate the total count and max_hits if needed
         max_hits = math.ceil(count / limit)
@@ -181,6 +193,20 @@ class OffsetPaginator:
             max_hits=max_hits,
         )
 
+    def get_count(self, queryset):
+        # Count the total number of rows for the queryset
+        return queryset.count()
+
+    def get_filtered_pks(self):
+        # Distinct primary keys of the filtered queryset, or of the
+        # paginated queryset when no filtered one is given
+        queryset = (
+            self.queryset
+            if self.filtered_queryset is None
+            else self.filtered_queryset
+        )
+        return queryset.order_by().values("pk").distinct()
+
     def process_results(self, results):
         raise NotImplementedError
 
@@ -286,7 +312,7 @@ class GroupedOffsetPaginator(OffsetPaginator):
         )
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_count(queryset)
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
@@ -528,7 +554,7 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         )
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_count(queryset)
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
@@ -720,6 +746,227 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
 
+class StrippedCountMixin:
+    """
+    Count the distinct issues of the filtered queryset so that the COUNT(*)
+    neither evaluates the response annotations nor joins their relations
+    """
+
+    def get_count(self, queryset):
+        return self.get_filtered_pks().count()
+
+
+class StrippedCountOffsetPaginator(StrippedCountMixin, OffsetPaginator):
+    pass
+
+
+def estimate_count(queryset):
+    # Row estimate of the planner for the queryset
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CountEstimateMixin:
+    """
+    Count exactly up to a threshold and fall back to the planner's row
+    estimate for larger querysets
+    """
+
+    # Largest count that is computed exactly
+    exact_count_threshold = 10_000
+
+    def get_count(self, queryset):
+        filtered_pks = self.get_filtered_pks()
+        # Bounded probe, stops reading after the threshold
+        count = filtered_pks[: self.exact_count_threshold + 1].count()
+        if count <= self.exact_count_threshold:
+            return count
+
+        self.is_estimated = True
+        # The estimate is never below the rows already seen
+        return max(estimate_count(filtered_pks), count)
+
+
+class EstimatedCountGroupedOffsetPaginator(
+    CountEstimateMixin, GroupedOffsetPaginator
+):
+    pass
+
+
+class EstimatedCountSubGroupedOffsetPaginator(
+    CountEstimateMixin, SubGroupedOffsetPaginator
+):
+    pass
+
+
+class TimeoutCountMixin:
+    """
+    Bound the time spent on the count with a statement timeout, returning
+    the planner's row estimate when the exact count takes longer than that
+    """
+
+    # Statement timeout in milliseconds
+    count_timeout = 200
+
+    def get_count(self, queryset):
+        try:
+            with transaction.atomic(using=queryset.db):
+                with connections[queryset.db].cursor() as cursor:
+                    cursor.execute(
+                        "SET LOCAL statement_timeout TO %d"
+                        % int(self.count_timeout)
+                    )
+                    count = super().get_count(queryset)
+                    # Reset the timeout in case of an outer transaction
+                    cursor.execute("SET LOCAL statement_timeout TO DEFAULT")
+                return count
+        except OperationalError as e:
+            if not isinstance(e.__cause__, QueryCanceled):
+                raise
+            self.is_estimated = True
+            return estimate_count(self.get_filtered_pks())
+
+
+class FastCountOffsetPaginator(
+    TimeoutCountMixin, StrippedCountOffsetPaginator
+):
+    pass
+
+
+class KeysetCursor(Cursor):
+    """
+    Cursor for the keyset paginator in the format `limit:created_at:id`,
+    where created_at is in microseconds since the epoch. The first page is
+    requested with `limit:0:start`.
+    """
+
+    EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+    def __init__(
+        self,
+        value,
+        created_at=None,
+        id=None,
+        is_prev=False,
+        has_results=None,
+        is_first_page=False,
+    ):
+        super().__init__(value, 0, is_prev, has_results)
+        self.created_at = created_at
+        self.id = id
+        self.is_first_page = is_first_page
+
+    def __str__(self):
+        if self.is_first_page:
+            return f"{self.value}:0:start"
+        if self.created_at is None:
+            raise ValueError("Keyset cursor requires a created_at and id")
+        created_at = (self.created_at - self.EPOCH) // timedelta(
+            microseconds=1
+        )
+        return f"{self.value}:{created_at}:{self.id}"
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor value from string format"""
+        try:
+            bits = value.split(":")
+            if len(bits) != 3:
+                raise ValueError(
+                    "Cursor must be in the format 'value:created_at:id'"
+                )
+
+            if bits[1:] == ["0", "start"]:
+                return cls(int(bits[0]), is_first_page=True)
+            return cls(
+                int(bits[0]),
+                cls.EPOCH + timedelta(microseconds=int(bits[1])),
+                uuid.UUID(bits[2]),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+    @classmethod
+    def is_keyset(cls, value):
+        # Check if the value is a keyset cursor, offset cursors do not parse
+        try:
+            cls.from_string(value)
+        except (AttributeError, ValueError):
+            return False
+        return True
+
+
+class KeysetPaginator(OffsetPaginator):
+    """
+    Forward only paginator over `(created_at, id)` in descending order.
+    Pages are selected by filtering on the last key of the previous page
+    instead of an OFFSET, so deep pages cost the same as the first one.
+    """
+
+    def get_result(self, limit=100, cursor=None):
+        if cursor is None:
+            cursor = KeysetCursor(limit, is_first_page=True)
+
+        # Get the min from limit and max limit
+        limit = min(limit, self.max_limit)
+
+        # Read the keys from the filtered queryset without the annotations
+        keys_queryset = self.get_filtered_pks()
+        # Continue after the last issue of the previous page
+        if cursor.created_at is not None:
+            keys_queryset = keys_queryset.filter(
+                Q(created_at__lt=cursor.created_at)
+                | Q(created_at=cursor.created_at, id__lt=cursor.id)
+            )
+
+        # Fetch one key more than the limit to check for the next page
+        keys = list(
+            keys_queryset.order_by("-created_at", "-id").values_list(
+                "created_at", "id"
+            )[: limit + 1]
+        )
+
+        # Load the annotated rows for the keys of this page only
+        results = self.queryset.filter(
+            pk__in=[id for _, id in keys[:limit]]
+        ).order_by("-created_at", "-id")
+
+        # The next page starts after the last key of this page. The last
+        # page still points past its last key, so following it returns an
+        # empty page instead of the first one again
+        if keys:
+            last_key = keys[:limit][-1]
+        elif cursor.created_at is not None:
+            last_key = (cursor.created_at, cursor.id)
+        else:
+            # Nothing to paginate, point before the earliest possible key
+            last_key = (KeysetCursor.EPOCH, uuid.UUID(int=0))
+        next_cursor = KeysetCursor(
+            limit, *last_key, has_results=len(keys) > limit
+        )
+        # Only forward pagination is supported, go back to the first page
+        prev_cursor = KeysetCursor(
+            limit, is_prev=True, has_results=False, is_first_page=True
+        )
+
+        # Count the queryset
+        count = self.get_count(self.queryset)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=math.ceil(count / limit),
+        )
+
+
+class FastCountKeysetPaginator(
+    TimeoutCountMixin, StrippedCountMixin, KeysetPaginator
+):
+    pass
+
+
 class BasePaginator:
     """BasePaginator class can be inherited by any View to return a paginated view"""
 
@@ -821,6 +1068,7 @@ class BasePaginator:
                 "count": cursor_result.__len__(),
                 "total_pages": cursor_result.max_hits,
                 "total_results": cursor_result.hits,
+                "is_estimated": paginator.is_estimated,
                 "extra_stats": extra_stats,
                 "results": results,
             }
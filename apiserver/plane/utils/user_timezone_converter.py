@@ -4,22 +4,30 @@ def user_timezone_converter(queryset, datetime_fields, user_timezone):
     # Create a timezone object for the user's timezone
     user_tz = pytz.timezone(user_timezone)
 
-    # Check if queryset is a dictionary (single item) or a list of dictionaries
-    if isinstance(queryset, dict):
-        queryset_values = [queryset]
-    else:
+    # Check if queryset is a dictionary (single item) or an iterable of
+    # dictionaries
+    single_item = isinstance(queryset, dict)
+    if single_item:
+        queryset = [queryset]
+
+    # The datetimes are already loaded in UTC from the database
+    if user_tz is pytz.utc:
         queryset_values = list(queryset)
+        return queryset_values[0] if single_item else queryset_values
 
-    # Iterate over the dictionaries in the list
-    for item in queryset_values:
+    # Convert the items while collecting them, so that querysets and
+    # iterators are only walked once
+    queryset_values = []
+    for item in queryset:
         # Iterate over the datetime fields
         for field in datetime_fields:
             # Convert the datetime field to the user's timezone
             if field in item and item[field]:
                 item[field] = item[field].astimezone(user_tz)
+        queryset_values.append(item)
 
     # If queryset was a single item, return a single item
-    if isinstance(queryset, dict):
+    if single_item:
         return queryset_values[0]
     else:
         return queryset_values